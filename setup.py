@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Build script for the optional compiled cleaning extension.
+
+The pipeline runs fine without it; when built, FijianDataCleaner picks up
+the C implementation of the clean+validate hot loop automatically.
+
+Usage:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(['src/_fijian_clean.pyx'], language_level=3)
+except ImportError:
+    ext_modules = []
+
+setup(
+    name='fijian-data-ft',
+    ext_modules=ext_modules,
+)
@@ -0,0 +1,83 @@
+# cython: language_level=3
+"""
+Fused clean + validate for the Fijian pipeline hot loop.
+
+Implements the same semantics as FijianDataCleaner.clean_text followed by
+is_valid_fijian_text, but in a single left-to-right C-level pass: HTML tags
+are skipped, disallowed punctuation is dropped, whitespace runs collapse to
+a single space, and the length / word-count / alpha-ratio checks are
+accumulated while the output is built.
+
+Build with: python setup.py build_ext --inplace
+"""
+
+from cpython.unicode cimport (
+    Py_UNICODE_ISALNUM,
+    Py_UNICODE_ISALPHA,
+    Py_UNICODE_ISSPACE,
+)
+
+
+cpdef clean_and_validate(str text):
+    """
+    Clean text and return it if it passes validation, else None.
+
+    Args:
+        text: Raw text string
+
+    Returns:
+        Cleaned text string, or None if the cleaned text is invalid
+    """
+    cdef Py_ssize_t n = len(text)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t close
+    cdef Py_ssize_t out_len = 0
+    cdef Py_ssize_t alpha_chars = 0
+    cdef Py_ssize_t spaces = 0
+    cdef bint pending_space = False
+    cdef Py_UCS4 ch
+    cdef list out = []
+
+    while i < n:
+        ch = text[i]
+
+        if ch == u'<':
+            # Skip a complete <...> tag; a bare '<' (no closing '>' or an
+            # empty '<>') is just disallowed punctuation and is dropped
+            close = text.find(u'>', i + 1)
+            if close > i + 1:
+                i = close + 1
+                continue
+            i += 1
+            continue
+
+        if Py_UNICODE_ISSPACE(ch):
+            pending_space = True
+            i += 1
+            continue
+
+        if not (Py_UNICODE_ISALNUM(ch) or ch == u'_' or ch in u"-'.,;:!?()"):
+            i += 1
+            continue
+
+        if pending_space and out_len > 0:
+            out.append(u' ')
+            out_len += 1
+            spaces += 1
+        pending_space = False
+
+        out.append(ch)
+        out_len += 1
+        if Py_UNICODE_ISALPHA(ch):
+            alpha_chars += 1
+        i += 1
+
+    # Same rejects as is_valid_fijian_text
+    if out_len < 3:
+        return None
+    if spaces < 1:
+        return None
+    if alpha_chars / <double>out_len < 0.6:
+        return None
+
+    return u''.join(out)
@@ -14,16 +14,109 @@ License: MIT
 """
 
 import argparse
+import contextlib
+import csv
 import json
 import logging
+import mmap
 import os
+import queue
 import re
 import sys
+import threading
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
-import pandas as pd
-from datasets import Dataset
+try:
+    import orjson
+
+    def _dumps_line(record: Dict) -> bytes:
+        """Serialize one record to a UTF-8 JSONL line using orjson."""
+        return orjson.dumps(record) + b'\n'
+
+except ImportError:
+    # C-accelerated JSON string escaping, the hot path inside json.dumps
+    from json.encoder import encode_basestring as _jstr
+
+    def _dumps_line(record: Dict) -> bytes:
+        """
+        Serialize one flat string-valued record to a UTF-8 JSONL line.
+
+        Every record the pipeline emits maps string keys to string values,
+        so the line is assembled by direct concatenation of escaped
+        strings, skipping json.dumps's per-call type dispatch.
+        """
+        return ('{' + ','.join(
+            _jstr(key) + ':' + _jstr(value) for key, value in record.items()
+        ) + '}\n').encode('utf-8')
+
+try:
+    # Optional compiled hot loop (python setup.py build_ext --inplace)
+    from _fijian_clean import clean_and_validate as _clean_and_validate_c
+except ImportError:
+    _clean_and_validate_c = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa = None
+
+
+# Precompiled cleaning patterns (module level so each process compiles
+# them once)
+_WS_RE = re.compile(r'\s+')
+
+# Fused pattern: strips HTML tags and disallowed punctuation in a single
+# scan of the string, leaving only the whitespace-normalize pass
+_CLEAN_RE = re.compile(r"<[^>]+>|[^\w\s\-'.,;:!?()]")
+
+
+# Runs of non-terminator characters, i.e. sentence candidates; finditer
+# over this yields one substring per real sentence instead of the full
+# fragment list (with empties) that re.split materializes
+_SENT_BOUND_RE = re.compile(r'[^.!?]+')
+
+# RE2-compatible equivalents of the cleaning patterns, shared by the
+# Arrow kernels and the optional re2 matcher. \p{L}\p{N} replace
+# Python's Unicode-aware \w, and RE2's ASCII-only \s is widened with
+# \v, the separator controls, NEL, and \p{Z} to match Python's \s
+_RE2_WS_CLASS = r'\s\v\x1c-\x1f\x85\p{Z}'
+_RE2_CLEAN_PAT = r"<[^>]+>|[^\p{L}\p{N}_" + _RE2_WS_CLASS + r"\-'.,;:!?()]"
+_RE2_WS_PAT = r'[' + _RE2_WS_CLASS + r']+'
+_RE2_ALPHA_PAT = r'\p{L}'
+
+# Below this size the stdlib csv reader beats the columnar readers'
+# fixed per-file setup costs
+_SMALL_CSV_BYTES = 16 * 1024 * 1024
+
+try:
+    # Optional DFA regex engine (pip install google-re2): linear-time
+    # scanning with no backtracking, a real win on long inputs
+    import re2 as _re2
+    _CLEAN_RE2 = _re2.compile(_RE2_CLEAN_PAT)
+    _WS_RE2 = _re2.compile(_RE2_WS_PAT)
+    _ALPHA_RE2 = _re2.compile(_RE2_ALPHA_PAT + r'+')
+except ImportError:
+    _re2 = None
+
+
+def _count_letters(text: str) -> int:
+    """
+    Count Unicode letter characters (category L*) in text.
+
+    Matches str.isalpha semantics, like the compiled extension and the
+    Arrow \\p{L} kernel; stdlib re has no letters-only class ([^\\W\\d_]
+    also matches Nl/No numerics), so without re2 the count falls back to
+    per-character isalpha.
+    """
+    if _re2 is not None:
+        return sum(len(m) for m in _ALPHA_RE2.findall(text))
+    return sum(map(str.isalpha, text))
 
 
 # Configure logging
@@ -73,23 +166,21 @@ class FijianDataCleaner:
         """
         if not text or not isinstance(text, str):
             return ""
-        
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove extra punctuation
-        text = re.sub(r'[^\w\s\-\'\.,;:!?()]', '', text)
-        
-        # Normalize Fijian characters (if needed)
-        # Add specific Fijian character normalization here
-        
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        return text
+
+        # Normalize Fijian characters to canonical (NFC) form so composed
+        # and decomposed macron vowels behave identically downstream
+        text = unicodedata.normalize('NFC', text)
+
+        # Remove HTML tags and extra punctuation in one scan, preferring
+        # the DFA engine when installed
+        if _re2 is not None:
+            text = _CLEAN_RE2.sub('', text)
+            return _WS_RE2.sub(' ', text).strip()
+
+        text = _CLEAN_RE.sub('', text)
+
+        # Normalize whitespace and strip leading/trailing whitespace
+        return _WS_RE.sub(' ', text).strip()
     
     def is_valid_fijian_text(self, text: str) -> bool:
         """
@@ -103,13 +194,13 @@ class FijianDataCleaner:
         """
         if not text or len(text.strip()) < 3:
             return False
-        
-        # Check for minimum length
-        if len(text.split()) < 2:
+
+        # Check for minimum length (cheap rejects exit before the ratio scan)
+        if text.count(' ') < 1:
             return False
-        
+
         # Check for non-alphabetic ratio (should be mostly text)
-        alpha_chars = sum(c.isalpha() for c in text)
+        alpha_chars = _count_letters(text)
         if alpha_chars / len(text) < 0.6:
             return False
         
@@ -118,6 +209,240 @@ class FijianDataCleaner:
         
         return True
     
+    def _clean_and_validate(self, text: str) -> Optional[str]:
+        """
+        Clean text and return it only if it passes validation.
+
+        Uses the compiled single-pass extension when it has been built,
+        otherwise falls back to clean_text + is_valid_fijian_text.
+
+        Args:
+            text: Raw text string
+
+        Returns:
+            Cleaned text string, or None if the cleaned text is invalid
+        """
+        if _clean_and_validate_c is not None:
+            if not text or not isinstance(text, str):
+                return None
+            return _clean_and_validate_c(unicodedata.normalize('NFC', text))
+
+        cleaned = self.clean_text(text)
+        if self.is_valid_fijian_text(cleaned):
+            return cleaned
+        return None
+
+    def _clean_series(self, series: 'pd.Series') -> 'pd.Series':
+        """
+        Clean a whole column of text at once using vectorized string ops.
+
+        Mirrors clean_text but runs the regex substitutions over the entire
+        column in C instead of once per row.
+
+        Args:
+            series: Column of raw text strings
+
+        Returns:
+            Column of cleaned text strings
+        """
+        series = series.str.normalize('NFC')
+        series = series.str.replace(_CLEAN_RE, '', regex=True)
+        series = series.str.replace(_WS_RE, ' ', regex=True)
+        return series.str.strip()
+
+    def _valid_fijian_mask(self, series: 'pd.Series') -> 'pd.Series':
+        """
+        Vectorized equivalent of is_valid_fijian_text over a column.
+
+        Args:
+            series: Column of cleaned text strings
+
+        Returns:
+            Boolean mask of rows that pass validation
+        """
+        lengths = series.str.len()
+        mask = series.str.strip().str.len() >= 3
+        mask &= series.str.split().str.len() >= 2
+        # Letters-only count, matching the scalar/compiled/Arrow paths
+        alpha_chars = series.map(_count_letters)
+        mask &= (alpha_chars / lengths.where(lengths > 0, 1)) >= 0.6
+        return mask
+
+    def _normalize_arrow(self, column: 'pa.Array') -> 'pa.Array':
+        """
+        NFC-normalize an Arrow string array.
+
+        pc.utf8_normalize cannot be trusted to compose on every pyarrow
+        build (some return decomposed output even for form='NFC'), which
+        would let the cleaning kernel strip combining macrons. Batches
+        containing combining marks are round-tripped through
+        unicodedata.normalize instead; mark-free batches pass through
+        untouched.
+
+        Args:
+            column: Arrow string array of raw text
+
+        Returns:
+            NFC-normalized Arrow string array
+        """
+        has_marks = pc.sum(pc.count_substring_regex(column, r'\p{M}')).as_py()
+        if not has_marks:
+            return column
+        return pa.array(
+            [unicodedata.normalize('NFC', value) for value in column.to_pylist()],
+            type=pa.string())
+
+    def _clean_arrow(self, column: 'pa.Array') -> 'pa.Array':
+        """
+        Clean an Arrow string array using compute kernels.
+
+        Same substitutions as clean_text, but run zero-copy in C over a
+        contiguous UTF-8 buffer.
+
+        Args:
+            column: Arrow string array of raw text
+
+        Returns:
+            Arrow string array of cleaned text
+        """
+        column = self._normalize_arrow(column)
+        column = pc.replace_substring_regex(
+            column, pattern=_RE2_CLEAN_PAT, replacement='')
+        column = pc.replace_substring_regex(
+            column, pattern=_RE2_WS_PAT, replacement=' ')
+        return pc.utf8_trim_whitespace(column)
+
+    def _valid_fijian_mask_arrow(self, column: 'pa.Array') -> 'pa.Array':
+        """
+        Vectorized equivalent of is_valid_fijian_text over an Arrow array.
+
+        Args:
+            column: Arrow string array of cleaned text
+
+        Returns:
+            Arrow boolean array of rows that pass validation
+        """
+        lengths = pc.max_element_wise(pc.utf8_length(column), 1)
+        mask = pc.greater_equal(
+            pc.utf8_length(pc.utf8_trim_whitespace(column)), 3)
+        mask = pc.and_(mask, pc.greater_equal(pc.count_substring(column, ' '), 1))
+        alpha_chars = pc.count_substring_regex(column, _RE2_ALPHA_PAT)
+        ratio = pc.divide(pc.cast(alpha_chars, pa.float64()),
+                          pc.cast(lengths, pa.float64()))
+        return pc.and_(mask, pc.greater_equal(ratio, 0.6))
+
+    def _process_csv_small(self, file_path: Path) -> List[Dict[str, str]]:
+        """
+        Extract dictionary entries from a small CSV with the stdlib reader.
+
+        The columnar readers pay a large fixed setup cost per file; below
+        the size threshold csv.DictReader is faster and allocates far less.
+
+        Args:
+            file_path: Path to dictionary CSV file
+
+        Returns:
+            List of dictionaries with word and definition pairs
+        """
+        entries = []
+        source = file_path.name
+
+        with open(file_path, newline='', encoding='utf-8-sig') as fh:
+            for row in csv.DictReader(fh):
+                word = self._clean_and_validate(row.get('fijian_word', ''))
+                definition = self.clean_text(row.get('english_definition', ''))
+
+                if word is not None and definition:
+                    entries.append({
+                        'fijian_word': word,
+                        'english_definition': definition,
+                        'source': source
+                    })
+
+        return entries
+
+    def _process_csv_arrow(self, file_path: Path) -> List[Dict[str, str]]:
+        """
+        Extract dictionary entries from a CSV using streaming Arrow batches.
+
+        Args:
+            file_path: Path to dictionary CSV file
+
+        Returns:
+            List of dictionaries with word and definition pairs
+        """
+        entries = []
+        convert_options = pacsv.ConvertOptions(
+            include_columns=['fijian_word', 'english_definition'],
+            column_types={'fijian_word': pa.string(),
+                          'english_definition': pa.string()},
+            strings_can_be_null=False
+        )
+        source = file_path.name
+
+        with pacsv.open_csv(file_path, convert_options=convert_options) as reader:
+            for batch in reader:
+                words = self._clean_arrow(batch.column('fijian_word'))
+                definitions = self._clean_arrow(batch.column('english_definition'))
+
+                mask = pc.and_(self._valid_fijian_mask_arrow(words),
+                               pc.greater(pc.utf8_length(definitions), 0))
+                entries.extend(
+                    {
+                        'fijian_word': word,
+                        'english_definition': definition,
+                        'source': source
+                    }
+                    for word, definition in zip(words.filter(mask).to_pylist(),
+                                                definitions.filter(mask).to_pylist())
+                )
+
+        return entries
+
+    def _process_csv_pandas(self, file_path: Path) -> List[Dict[str, str]]:
+        """
+        Extract dictionary entries from a CSV using chunked pandas reads.
+
+        Fallback for environments without pyarrow.
+
+        Args:
+            file_path: Path to dictionary CSV file
+
+        Returns:
+            List of dictionaries with word and definition pairs
+        """
+        # Local import keeps pandas off the critical startup path (and out
+        # of text-only runs and respawned worker processes)
+        import pandas as pd
+
+        entries = []
+        reader = pd.read_csv(
+            file_path,
+            dtype={'fijian_word': 'string', 'english_definition': 'string'},
+            usecols=['fijian_word', 'english_definition'],
+            chunksize=100_000,
+            na_filter=False,
+            engine='c'
+        )
+        source = file_path.name
+
+        for chunk in reader:
+            words = self._clean_series(chunk['fijian_word'])
+            definitions = self._clean_series(chunk['english_definition'])
+
+            mask = self._valid_fijian_mask(words) & (definitions.str.len() > 0)
+            entries.extend(
+                {
+                    'fijian_word': word,
+                    'english_definition': definition,
+                    'source': source
+                }
+                for word, definition in zip(words[mask].tolist(),
+                                            definitions[mask].tolist())
+            )
+
+        return entries
+
     def process_dictionary_file(self, file_path: Path) -> List[Dict[str, str]]:
         """
         Process a dictionary file and extract word definitions.
@@ -132,48 +457,88 @@ class FijianDataCleaner:
         
         try:
             if file_path.suffix.lower() == '.csv':
-                df = pd.read_csv(file_path)
-                for _, row in df.iterrows():
-                    # Assuming columns: 'fijian_word', 'english_definition'
-                    # Adjust column names based on actual data structure
-                    if 'fijian_word' in df.columns and 'english_definition' in df.columns:
-                        word = self.clean_text(str(row['fijian_word']))
-                        definition = self.clean_text(str(row['english_definition']))
-                        
-                        if self.is_valid_fijian_text(word) and definition:
-                            entries.append({
-                                'fijian_word': word,
-                                'english_definition': definition,
-                                'source': file_path.name
-                            })
+                # Assuming columns: 'fijian_word', 'english_definition'
+                # Adjust column names based on actual data structure; one
+                # header read replaces the old per-row column checks
+                # (utf-8-sig strips the BOM that Excel exports prepend)
+                with open(file_path, 'r', encoding='utf-8-sig', newline='') as fh:
+                    header = next(csv.reader(fh), [])
+                if 'fijian_word' in header and 'english_definition' in header:
+                    if file_path.stat().st_size < _SMALL_CSV_BYTES:
+                        entries.extend(self._process_csv_small(file_path))
+                    elif pa is not None:
+                        entries.extend(self._process_csv_arrow(file_path))
+                    else:
+                        entries.extend(self._process_csv_pandas(file_path))
+                else:
+                    logger.warning(
+                        f"Skipping {file_path.name}: expected 'fijian_word' and "
+                        f"'english_definition' columns, found {header}")
             
             elif file_path.suffix.lower() == '.txt':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Try to parse word/definition pairs
-                        # Adjust parsing logic based on actual file format
-                        if ' - ' in line:
-                            parts = line.split(' - ', 1)
-                            if len(parts) == 2:
-                                word = self.clean_text(parts[0])
-                                definition = self.clean_text(parts[1])
-                                
-                                if self.is_valid_fijian_text(word) and definition:
-                                    entries.append({
-                                        'fijian_word': word,
-                                        'english_definition': definition,
-                                        'source': f"{file_path.name}:L{line_num}"
-                                    })
+                entries.extend(self._process_txt_dictionary(file_path))
         
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
         
         return entries
     
+    def _process_txt_dictionary(self, file_path: Path) -> List[Dict[str, str]]:
+        """
+        Extract word/definition pairs from a ' - '-separated text dictionary.
+
+        Memory-maps the file and scans for newlines in C; only lines
+        containing the separator are decoded to str, so blank lines and
+        non-entry lines never allocate Python strings.
+
+        Args:
+            file_path: Path to dictionary text file
+
+        Returns:
+            List of dictionaries with word and definition pairs
+        """
+        entries = []
+        name = file_path.name
+
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return entries
+
+            with mm:
+                size = len(mm)
+                start = 0
+                line_num = 0
+                while start < size:
+                    nl = mm.find(b'\n', start)
+                    if nl == -1:
+                        nl = size
+                    line_num += 1
+
+                    # Try to parse word/definition pairs; the bytes-level
+                    # pre-filter skips lines without the separator before
+                    # any decoding happens
+                    # Adjust parsing logic based on actual file format
+                    if mm.find(b' - ', start, nl) != -1:
+                        line = mm[start:nl].decode('utf-8').strip()
+                        parts = line.split(' - ', 1)
+                        if len(parts) == 2:
+                            word = self._clean_and_validate(parts[0])
+                            definition = self.clean_text(parts[1])
+
+                            if word is not None and definition:
+                                entries.append({
+                                    'fijian_word': word,
+                                    'english_definition': definition,
+                                    'source': f"{name}:L{line_num}"
+                                })
+
+                    start = nl + 1
+
+        return entries
+
     def process_text_file(self, file_path: Path) -> List[str]:
         """
         Process a general text file and extract clean sentences.
@@ -185,118 +550,220 @@ class FijianDataCleaner:
             List of cleaned sentences
         """
         sentences = []
-        
+
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Split into sentences (basic approach)
-            raw_sentences = re.split(r'[.!?]+', content)
-            
-            for sentence in raw_sentences:
-                cleaned = self.clean_text(sentence)
-                if self.is_valid_fijian_text(cleaned):
-                    sentences.append(cleaned)
-        
+                sentences.extend(self._iter_sentences(f))
+
         except Exception as e:
             logger.error(f"Error processing {file_path}: {str(e)}")
-        
+
         return sentences
+
+    def _iter_sentences(self, f, chunk_size: int = 1 << 20):
+        """
+        Yield cleaned, validated sentences from an open text stream.
+
+        Reads the file in fixed-size chunks and carries only the trailing
+        unterminated fragment between reads, so peak memory stays
+        O(chunk_size) instead of O(file).
+
+        Args:
+            f: Open text-mode file object
+            chunk_size: Number of characters to read per chunk
+
+        Yields:
+            Cleaned sentences that pass validation
+        """
+        remainder = ''
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+
+            buffer = remainder + chunk
+            remainder = ''
+
+            for match in _SENT_BOUND_RE.finditer(buffer):
+                if match.end() == len(buffer):
+                    # Unterminated tail; carry it into the next chunk
+                    remainder = match.group()
+                    break
+                cleaned = self._clean_and_validate(match.group())
+                if cleaned is not None:
+                    yield cleaned
+
+        cleaned = self._clean_and_validate(remainder)
+        if cleaned is not None:
+            yield cleaned
     
     def process_all_files(self):
-        """Process all files in the input directory."""
-        dictionary_entries = []
-        text_sentences = []
-        
-        # Process all files recursively
-        for file_path in self.input_dir.rglob('*'):
-            if file_path.is_file():
-                logger.info(f"Processing {file_path}")
-                
-                if 'dict' in file_path.name.lower() or 'dictionary' in file_path.name.lower():
-                    entries = self.process_dictionary_file(file_path)
-                    dictionary_entries.extend(entries)
+        """Process all files in the input directory, streaming output to disk."""
+        # Bucket files up front so each class can be fanned out to workers
+        file_paths = [p for p in self.input_dir.rglob('*') if p.is_file()]
+        dict_paths = [p for p in file_paths
+                      if 'dict' in p.name.lower() or 'dictionary' in p.name.lower()]
+        dict_set = set(dict_paths)
+        text_paths = [p for p in file_paths
+                      if p not in dict_set and p.suffix.lower() in ['.txt', '.csv']]
+
+        # Largest files first, so the long-pole files are dispatched to
+        # workers before the pool starts to drain
+        dict_paths.sort(key=lambda p: p.stat().st_size, reverse=True)
+        text_paths.sort(key=lambda p: p.stat().st_size, reverse=True)
+
+        dict_file = self.output_dir / 'fijian_dictionary.jsonl'
+        text_file = self.output_dir / 'fijian_text.jsonl'
+        train_file = self.output_dir / 'fijian_training_data.jsonl'
+
+        dict_count = 0
+        text_count = 0
+
+        # Open all output writers up front and emit records as they are
+        # produced, so the corpus is never buffered in memory. Each file
+        # is independent, so cleaning fans out across worker processes
+        # while the parent streams results to disk in input order.
+        with contextlib.ExitStack() as stack:
+            dict_f = stack.enter_context(open(dict_file, 'wb', buffering=1 << 20))
+            text_f = stack.enter_context(open(text_file, 'wb', buffering=1 << 20))
+            train_f = stack.enter_context(open(train_file, 'wb', buffering=1 << 20))
+            executor = stack.enter_context(ProcessPoolExecutor())
+
+            # One writer thread drains serialized batches so cleaning and
+            # serialization overlap with disk latency; the bounded queue
+            # keeps at most a few batches in flight
+            write_queue = queue.Queue(maxsize=16)
+            write_errors: List[Exception] = []
+            writer = threading.Thread(
+                target=_writer_loop, args=(write_queue, write_errors), daemon=True)
+            writer.start()
+
+            try:
+                dict_results = executor.map(
+                    partial(_process_dict_worker, self), dict_paths, chunksize=4)
+                for file_path, entries in zip(dict_paths, dict_results):
+                    write_queue.put((dict_f, [_dumps_line(e) for e in entries]))
+                    write_queue.put((train_f, [
+                        _dumps_line(self._definition_record(e)) for e in entries]))
+                    dict_count += len(entries)
                     logger.info(f"Extracted {len(entries)} dictionary entries from {file_path.name}")
-                
-                elif file_path.suffix.lower() in ['.txt', '.csv']:
-                    sentences = self.process_text_file(file_path)
-                    text_sentences.extend(sentences)
+                    self.stats['files_processed'] += 1
+
+                text_results = executor.map(
+                    partial(_process_text_worker, self), text_paths, chunksize=4)
+                for file_path, sentences in zip(text_paths, text_results):
+                    write_queue.put((text_f, [
+                        _dumps_line({'text': s}) for s in sentences]))
+                    write_queue.put((train_f, [
+                        _dumps_line(self._completion_record(s)) for s in sentences]))
+                    text_count += len(sentences)
                     logger.info(f"Extracted {len(sentences)} sentences from {file_path.name}")
-                
-                self.stats['files_processed'] += 1
-        
-        # Save processed data
-        self.save_processed_data(dictionary_entries, text_sentences)
-    
-    def save_processed_data(self, dictionary_entries: List[Dict], text_sentences: List[str]):
-        """
-        Save processed data to output files.
-        
-        Args:
-            dictionary_entries: List of dictionary entry dictionaries
-            text_sentences: List of text sentences
-        """
-        # Save dictionary data
-        if dictionary_entries:
-            dict_file = self.output_dir / 'fijian_dictionary.jsonl'
-            with open(dict_file, 'w', encoding='utf-8') as f:
-                for entry in dictionary_entries:
-                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
-            logger.info(f"Saved {len(dictionary_entries)} dictionary entries to {dict_file}")
-        
-        # Save text data
-        if text_sentences:
-            text_file = self.output_dir / 'fijian_text.jsonl'
-            with open(text_file, 'w', encoding='utf-8') as f:
-                for sentence in text_sentences:
-                    f.write(json.dumps({'text': sentence}, ensure_ascii=False) + '\n')
-            logger.info(f"Saved {len(text_sentences)} sentences to {text_file}")
-        
-        # Save combined training data
-        self.create_training_data(dictionary_entries, text_sentences)
-        
+                    self.stats['files_processed'] += 1
+            finally:
+                # Writer must drain and exit before ExitStack closes the files
+                write_queue.put(None)
+                writer.join()
+
+        # Surface a failed write instead of reporting success on a
+        # truncated output
+        if write_errors:
+            raise write_errors[0]
+
+        logger.info(f"Saved {dict_count} dictionary entries to {dict_file}")
+        logger.info(f"Saved {text_count} sentences to {text_file}")
+        logger.info(f"Saved {dict_count + text_count} training examples to {train_file}")
+
         # Save statistics
         stats_file = self.output_dir / 'processing_stats.json'
         with open(stats_file, 'w', encoding='utf-8') as f:
             json.dump(self.stats, f, indent=2)
         logger.info(f"Processing statistics saved to {stats_file}")
-    
-    def create_training_data(self, dictionary_entries: List[Dict], text_sentences: List[str]):
+
+    def _definition_record(self, entry: Dict[str, str]) -> Dict[str, str]:
         """
-        Create training data in various formats for different fine-tuning approaches.
-        
+        Build a definition-task training record from a dictionary entry.
+
         Args:
-            dictionary_entries: Dictionary entries
-            text_sentences: Text sentences
+            entry: Dictionary entry with word and definition
+
+        Returns:
+            Training record for definition tasks
         """
-        training_data = []
-        
-        # Convert dictionary entries to training format
-        for entry in dictionary_entries:
-            # Format for translation/definition tasks
-            training_data.append({
-                'instruction': f"Define the Fijian word: {entry['fijian_word']}",
-                'input': entry['fijian_word'],
-                'output': entry['english_definition'],
-                'task_type': 'definition'
-            })
-        
-        # Add text for language modeling
-        for sentence in text_sentences:
-            training_data.append({
-                'instruction': "Complete the following Fijian text:",
-                'input': sentence[:len(sentence)//2],  # First half as input
-                'output': sentence[len(sentence)//2:],  # Second half as output
-                'task_type': 'completion'
-            })
-        
-        # Save training data
-        if training_data:
-            train_file = self.output_dir / 'fijian_training_data.jsonl'
-            with open(train_file, 'w', encoding='utf-8') as f:
-                for item in training_data:
-                    f.write(json.dumps(item, ensure_ascii=False) + '\n')
-            logger.info(f"Saved {len(training_data)} training examples to {train_file}")
+        return {
+            'instruction': f"Define the Fijian word: {entry['fijian_word']}",
+            'input': entry['fijian_word'],
+            'output': entry['english_definition'],
+            'task_type': 'definition'
+        }
+
+    def _completion_record(self, sentence: str) -> Dict[str, str]:
+        """
+        Build a completion-task training record from a text sentence.
+
+        Args:
+            sentence: Cleaned text sentence
+
+        Returns:
+            Training record for language-modeling tasks
+        """
+        # Split at the whitespace boundary nearest the midpoint so neither
+        # half ends in a broken word; fall back to the raw midpoint for
+        # sentences with no space in the first half
+        half = len(sentence) >> 1
+        pivot = sentence.rfind(' ', 0, half)
+        if pivot == -1:
+            first, second = sentence[:half], sentence[half:]
+        else:
+            first, second = sentence[:pivot], sentence[pivot + 1:]
+
+        return {
+            'instruction': "Complete the following Fijian text:",
+            'input': first,
+            'output': second,
+            'task_type': 'completion'
+        }
+
+
+def _writer_loop(write_queue: 'queue.Queue', errors: List[Exception]):
+    """
+    Drain (writer, batch) messages from the queue onto their file objects.
+
+    Runs in a dedicated thread so serialization and cleaning overlap with
+    disk I/O. A None message signals completion. If a write fails, the
+    error is recorded and the loop keeps draining (discarding batches) so
+    producers never block on a full queue; the caller re-raises the first
+    recorded error after joining the thread.
+    """
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        if errors:
+            continue
+        writer, batch = item
+        try:
+            writer.writelines(batch)
+        except Exception as e:
+            logger.error(f"Write failed: {str(e)}")
+            errors.append(e)
+
+
+def _process_dict_worker(cleaner: 'FijianDataCleaner', file_path: Path) -> List[Dict[str, str]]:
+    """
+    Process one dictionary file in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    return cleaner.process_dictionary_file(file_path)
+
+
+def _process_text_worker(cleaner: 'FijianDataCleaner', file_path: Path) -> List[str]:
+    """
+    Process one text file in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+    """
+    return cleaner.process_text_file(file_path)
 
 
 def main():
@@ -12,6 +12,7 @@ import os
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import fijian_data_cleaning_pipeline
 from fijian_data_cleaning_pipeline import FijianDataCleaner
 
 
@@ -50,6 +51,15 @@ class TestFijianDataCleaner:
         result = self.cleaner.clean_text(None)
         assert result == ""
     
+    def test_clean_text_normalizes_unicode(self):
+        """Test that composed and decomposed characters clean identically."""
+        # U+0101 (a-macron) vs 'a' + U+0304 (combining macron)
+        composed = "vā vinaka"
+        decomposed = "vā vinaka"
+
+        assert self.cleaner.clean_text(decomposed) == self.cleaner.clean_text(composed)
+        assert self.cleaner.clean_text(decomposed) == "vā vinaka"
+
     def test_is_valid_fijian_text(self):
         """Test Fijian text validation."""
         # Valid Fijian text
@@ -83,6 +93,37 @@ class TestFijianDataCleaner:
         assert entries[0]['english_definition'] == 'hello or life'
         assert entries[0]['source'] == 'test_dict.csv'
     
+    def test_process_dictionary_csv_paths_agree(self):
+        """Test that every CSV implementation extracts identical entries."""
+        rows = ('fijian_word,english_definition\n'
+                'v\u0101 vinaka,thank you very much\n'
+                'bula vinaka,<b>hello</b> there\n'
+                '123!@#,not a word\n')
+
+        test_csv = self.input_dir / 'parity_dict.csv'
+        with open(test_csv, 'w', encoding='utf-8') as f:
+            f.write(rows)
+
+        expected = self.cleaner._process_csv_small(test_csv)
+
+        # The macron survives cleaning and the HTML tags are stripped
+        assert len(expected) == 2
+        assert expected[0]['fijian_word'] == 'v\u0101 vinaka'
+        assert expected[1]['english_definition'] == 'hello there'
+
+        assert self.cleaner._process_csv_pandas(test_csv) == expected
+        if fijian_data_cleaning_pipeline.pa is not None:
+            assert self.cleaner._process_csv_arrow(test_csv) == expected
+
+        # A BOM'd copy (Excel export) must not be skipped by the header check
+        bom_csv = self.input_dir / 'parity_dict_bom.csv'
+        with open(bom_csv, 'w', encoding='utf-8-sig') as f:
+            f.write(rows)
+
+        bom_entries = self.cleaner.process_dictionary_file(bom_csv)
+        assert [(e['fijian_word'], e['english_definition']) for e in bom_entries] == \
+            [(e['fijian_word'], e['english_definition']) for e in expected]
+
     def test_process_text_data(self):
         """Test text file processing."""
         # Create test text file